@@ -1,17 +1,78 @@
 import datetime as dt
+import hashlib
 import pathlib
 import re
+import shutil
+import zipfile
 from typing import Optional, Tuple
 
+import numpy as np
 import pandas as pd
 import requests
-from openpyxl import load_workbook
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 BASE_URL = "https://www.ezmoney.com.tw"
 FUND_CODE = "49YTW"
 ETF_CODE = "00981A"
 INFO_URL = f"{BASE_URL}/ETF/Fund/Info?FundCode={FUND_CODE}"
 EXPORT_URL = f"{BASE_URL}/ETF/Fund/AssetExcelNPOI?fundCode={FUND_CODE}"
+DATA_DIR = pathlib.Path("data")
+RAW_DIR = DATA_DIR / "raw"
+OUT_DIR = DATA_DIR / "out"
+HOLDINGS_DIR = OUT_DIR / "holdings"
+DIFF_CSV_DIR = OUT_DIR / "diff" / "csv"
+DIFF_MD_DIR = OUT_DIR / "diff" / "md"
+TMP_XLSX_PATH = RAW_DIR / f"{ETF_CODE}_portfolio_tmp.xlsx"
+LATEST_PATH = HOLDINGS_DIR / f"{ETF_CODE}_latest.csv"
+ROOT_LATEST_PATH = OUT_DIR / f"{ETF_CODE}_latest.csv"
+LAST_DIGEST_PATH = RAW_DIR / f".{ETF_CODE}_last_digest"
+DATA_DATE_LABEL = "資料日期"
+DATA_DATE_RE = re.compile(
+    rf"{DATA_DATE_LABEL}[^<]*?(\d{{2,3}})\s*(?:/|-|年)\s*(\d{{1,2}})\s*(?:/|-|月)\s*(\d{{1,2}})".encode("utf-8")
+)
+CODE_KEYS = ("代號", "股票代號", "標的代號", "證券代號")
+NAME_KEYS = ("名稱", "標的名稱", "股票名稱", "股名")
+SHARES_KEYS = ("股數", "持股股數", "數量", "持有股數")
+CODE_KEYS_RE = re.compile("|".join(CODE_KEYS))
+NAME_KEYS_RE = re.compile("|".join(NAME_KEYS))
+SHARES_KEYS_RE = re.compile("|".join(SHARES_KEYS))
+WHITESPACE_RE = re.compile(r"\s+")
+SHARES_NOISE_RE = re.compile(r"[,\s]+")
+CODE_RE = re.compile(r"^[0-9A-Za-z.\-]+$")
+STATUS_ORDER = ["NEW", "UP", "DOWN", "OUT", "SAME"]
+PAYLOAD_MAGIC = {b"PK\x03\x04": "zip", b"PK\x05\x06": "zip_empty"}
+HTML_PREFIX_RE = re.compile(rb"\s*<(?:!doctype|html)", re.I)
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 Chrome/130.0 Safari/537.36"
+
+_SESSION: Optional[requests.Session] = None
+
+
+def get_session() -> requests.Session:
+    global _SESSION
+    if _SESSION is None:
+        session = requests.Session()
+        session.headers.update(
+            {
+                "User-Agent": USER_AGENT,
+                "Accept": "text/html,application/vnd.openxmlformats-officedocument.spreadsheetml.sheet,*/*;q=0.8",
+                "Accept-Language": "zh-TW,zh;q=0.9",
+                "Accept-Encoding": "gzip, deflate",
+                "Referer": INFO_URL,
+            }
+        )
+        retry = Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=(429, 500, 502, 503, 504),
+            raise_on_status=False,
+            allowed_methods=("GET", "HEAD"),
+        )
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=1, max_retries=retry)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        _SESSION = session
+    return _SESSION
 
 
 def ensure_dir(p: pathlib.Path) -> None:
@@ -33,49 +94,57 @@ def roc_to_ad_yyyymmdd(roc_date_str: str) -> Optional[str]:
     return d.strftime("%Y%m%d")
 
 
-def extract_data_date_from_xlsx(xlsx_path: pathlib.Path) -> Optional[str]:
-    wb = load_workbook(xlsx_path, read_only=True, data_only=True)
-    ws = wb.worksheets[0]
-    for r in range(1, 21):
-        for c in range(1, 11):
-            v = ws.cell(row=r, column=c).value
-            if v is None:
+def extract_data_date_from_xlsx(xlsx_path: pathlib.Path, df_raw: pd.DataFrame) -> Optional[str]:
+    with zipfile.ZipFile(xlsx_path) as zf:
+        try:
+            shared = zf.read("xl/sharedStrings.xml")
+        except KeyError:
+            shared = b""
+    match = DATA_DATE_RE.search(shared)
+    if match:
+        d = roc_to_ad_yyyymmdd(b"/".join(match.groups()).decode("ascii"))
+        if d:
+            return d
+    return scan_data_date_cells(df_raw)
+
+
+def scan_data_date_cells(df_raw: pd.DataFrame) -> Optional[str]:
+    cells = df_raw.iloc[:20, :11].to_numpy(dtype=object)
+    n_cols = cells.shape[1]
+    for row in cells:
+        for c in range(min(10, n_cols)):
+            v = row[c]
+            if pd.isna(v):
                 continue
             txt = str(v).strip()
-            if "資料日期" not in txt:
+            if DATA_DATE_LABEL not in txt:
                 continue
-            after = txt.split("資料日期", 1)[-1].replace("：", ":")
+            after = txt.split(DATA_DATE_LABEL, 1)[-1].replace("：", ":")
             if ":" in after:
                 after = after.split(":", 1)[-1].strip()
             d = roc_to_ad_yyyymmdd(after)
             if d:
-                wb.close()
                 return d
-            v2 = ws.cell(row=r, column=c + 1).value
-            d2 = roc_to_ad_yyyymmdd(v2) if v2 is not None else None
+            v2 = row[c + 1] if c + 1 < n_cols else None
+            d2 = roc_to_ad_yyyymmdd(v2) if v2 is not None and not pd.isna(v2) else None
             if d2:
-                wb.close()
                 return d2
-    wb.close()
     return None
 
 
 def normalize_colname(s: str) -> str:
-    return re.sub(r"\s+", "", str(s)).strip()
+    return WHITESPACE_RE.sub("", str(s)).strip()
 
 
 def find_header_row(df_raw: pd.DataFrame) -> Optional[int]:
-    code_keys = ["代號", "股票代號", "標的代號", "證券代號"]
-    name_keys = ["名稱", "標的名稱", "股票名稱", "股名"]
-    shares_keys = ["股數", "持股股數", "數量", "持有股數"]
-    for i in range(min(40, len(df_raw))):
-        row = df_raw.iloc[i].astype(str).fillna("").tolist()
+    rows = df_raw.head(40).astype("string").fillna("").to_numpy()
+    for i, row in enumerate(rows):
         row_join = " ".join([x.strip() for x in row if x and x != "nan"]).strip()
         if not row_join:
             continue
-        has_code = any(k in row_join for k in code_keys)
-        has_name = any(k in row_join for k in name_keys)
-        has_shares = any(k in row_join for k in shares_keys)
+        has_code = CODE_KEYS_RE.search(row_join) is not None
+        has_name = NAME_KEYS_RE.search(row_join) is not None
+        has_shares = SHARES_KEYS_RE.search(row_join) is not None
         if has_code and has_shares:
             return i
         if has_code and has_name and has_shares:
@@ -83,123 +152,142 @@ def find_header_row(df_raw: pd.DataFrame) -> Optional[int]:
     return None
 
 
-def pick_column(cols, candidates):
-    for cand in candidates:
-        for col in cols:
-            if cand in normalize_colname(col):
-                return col
-    return None
+def pick_column(cols, pattern: re.Pattern):
+    return next((col for col in cols if pattern.search(normalize_colname(col))), None)
 
 
-def to_int_safe(x) -> int:
-    if x is None:
-        return 0
-    s = str(x).strip()
-    if s == "" or s.lower() == "nan":
-        return 0
-    s = s.replace(",", "").replace(" ", "")
-    try:
-        return int(float(s))
-    except ValueError:
-        return 0
+def open_info_page(session: requests.Session) -> None:
+    resp_info = session.head(INFO_URL, timeout=30, allow_redirects=True)
+    if not resp_info.ok:
+        with session.get(INFO_URL, timeout=30, stream=True) as resp_info:
+            resp_info.raise_for_status()
+    print("[INFO] Opened fund info page")
+
+
+def stream_export(session: requests.Session, out_path: pathlib.Path, raise_http: bool = False) -> Optional[str]:
+    with session.get(EXPORT_URL, timeout=60, stream=True) as resp_xlsx:
+        if not resp_xlsx.ok:
+            if raise_http:
+                resp_xlsx.raise_for_status()
+            return f"HTTP {resp_xlsx.status_code}"
+        print(f"[INFO] Download API Content-Type: {resp_xlsx.headers.get('Content-Type')}")
+        resp_xlsx.raw.decode_content = True
+        head = resp_xlsx.raw.read(64)
+        kind = PAYLOAD_MAGIC.get(head[:4]) or ("html" if HTML_PREFIX_RE.match(head) else "unknown")
+        if kind != "zip":
+            return f"判定為 {kind}，前 8 bytes：{head[:8]!r}"
+        with out_path.open("wb") as f:
+            f.write(head)
+            shutil.copyfileobj(resp_xlsx.raw, f, length=64 * 1024)
+    return None
 
 
 def download_xlsx(session: requests.Session, out_path: pathlib.Path) -> None:
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 Chrome/130.0 Safari/537.36"
-    }
-    resp_info = session.get(INFO_URL, headers=headers, timeout=30)
-    resp_info.raise_for_status()
-    print("[INFO] Opened fund info page")
-    resp_xlsx = session.get(EXPORT_URL, headers=headers, timeout=60)
-    resp_xlsx.raise_for_status()
-    print(f"[INFO] Download API Content-Type: {resp_xlsx.headers.get('Content-Type')}")
-    out_path.write_bytes(resp_xlsx.content)
+    # The export usually works without the Info page cookies; only warm up when it does not.
+    problem = stream_export(session, out_path)
+    if problem:
+        print(f"[INFO] Direct export not usable ({problem}); retrying after fund info page")
+        open_info_page(session)
+        problem = stream_export(session, out_path, raise_http=True)
+        if problem:
+            raise RuntimeError(f"下載內容不是 XLSX（{problem}）")
     print(f"[OK] Saved XLSX to {out_path}")
 
 
+def xlsx_content_digest(xlsx_path: pathlib.Path) -> str:
+    # NPOI stamps docProps and zip entry times on every export, so hash only the
+    # sheet parts, using the CRCs from the central directory (nothing is inflated).
+    digest = hashlib.sha256()
+    with zipfile.ZipFile(xlsx_path) as zf:
+        for info in zf.infolist():
+            if info.filename.startswith("xl/"):
+                digest.update(f"{info.filename}:{info.CRC:08x}:{info.file_size}\n".encode("utf-8"))
+    return digest.hexdigest()
+
+
 def parse_holdings_from_xlsx(xlsx_path: pathlib.Path) -> Tuple[pd.DataFrame, Optional[str]]:
-    data_date = extract_data_date_from_xlsx(xlsx_path)
+    df0 = pd.read_excel(xlsx_path, sheet_name=0, header=None, engine="calamine")
+    data_date = extract_data_date_from_xlsx(xlsx_path, df0)
     if data_date:
         print(f"[INFO] data_date = {data_date}")
     else:
         print("[WARN] data_date not found; fallback to today")
 
-    df0 = pd.read_excel(xlsx_path, sheet_name=0, header=None, engine="openpyxl")
     header_row = find_header_row(df0)
     if header_row is None:
         preview = df0.head(5).to_string(index=False)
         raise RuntimeError(f"找不到表頭列（代號/股數）。\n前 5 列預覽：\n{preview}")
 
-    df = pd.read_excel(xlsx_path, sheet_name=0, header=header_row, engine="openpyxl")
-    df.columns = [normalize_colname(c) for c in df.columns]
+    df = df0.iloc[header_row + 1 :].reset_index(drop=True)
+    df.columns = [normalize_colname(c) for c in df0.iloc[header_row].tolist()]
 
-    code_col = pick_column(df.columns, ["代號", "股票代號", "標的代號", "證券代號"])
-    name_col = pick_column(df.columns, ["名稱", "標的名稱", "股票名稱", "股名"])
-    shares_col = pick_column(df.columns, ["股數", "持股股數", "數量", "持有股數"])
+    code_col = pick_column(df.columns, CODE_KEYS_RE)
+    name_col = pick_column(df.columns, NAME_KEYS_RE)
+    shares_col = pick_column(df.columns, SHARES_KEYS_RE)
     if not code_col or not shares_col:
         raise RuntimeError(f"找不到必要欄位（代號/股數）。目前欄位：{list(df.columns)}")
 
     rename_map = {code_col: "code", shares_col: "shares"}
     if name_col:
         rename_map[name_col] = "name"
-    df = df[list(rename_map.keys())].copy().rename(columns=rename_map)
+    df = df[list(rename_map.keys())].rename(columns=rename_map)
     if "name" not in df.columns:
         df["name"] = ""
 
     df["code"] = df["code"].astype("string").str.strip()
     df["name"] = df["name"].astype("string").str.strip()
-    df["shares"] = df["shares"].apply(to_int_safe)
-    df = df[df["code"].notna()]
-    df = df[df["code"].str.len() > 0]
-    df = df[~df["code"].str.contains("合計|總計|小計", regex=True, na=False)]
-    df = df[df["code"].str.match(r"^[0-9A-Za-z.\-]+$", na=False)]
-    df = df.groupby(["code", "name"], as_index=False)["shares"].sum()
-    df = df.sort_values("shares", ascending=False).reset_index(drop=True)
+    shares = df["shares"].astype("string").str.replace(SHARES_NOISE_RE, "", regex=True)
+    df["shares"] = pd.to_numeric(shares, errors="coerce").fillna(0).astype("int64")
+    # CODE_RE only admits non-empty ASCII codes, which also rules out blank and 合計/總計/小計 rows.
+    df = df[df["code"].str.match(CODE_RE, na=False)]
+    if not df["code"].is_unique:
+        df = df.groupby("code", as_index=False, sort=False).agg(name=("name", "first"), shares=("shares", "sum"))
+    df = df.sort_values(["shares", "code"], ascending=[False, True], ignore_index=True)
     return df[["code", "name", "shares"]], data_date
 
 
+def read_holdings_csv(csv_path: pathlib.Path) -> pd.DataFrame:
+    return pd.read_csv(csv_path, dtype={"code": "string", "name": "string"}, encoding="utf-8-sig")
+
+
 def compute_diff(prev_df: pd.DataFrame, curr_df: pd.DataFrame) -> pd.DataFrame:
-    prev = prev_df.copy()
-    curr = curr_df.copy()
-    prev["code"] = prev["code"].astype("string").str.strip()
-    curr["code"] = curr["code"].astype("string").str.strip()
-    prev = prev.rename(columns={"shares": "prev_shares"})
-    curr = curr.rename(columns={"shares": "curr_shares"})
-    merged = prev.merge(curr, on=["code"], how="outer", suffixes=("_prev", "_curr"))
-    merged["name"] = merged.get("name_curr", "").fillna("")
-    if "name_prev" in merged.columns:
-        merged.loc[merged["name"].eq("") | merged["name"].isna(), "name"] = merged["name_prev"].fillna("")
-    merged["prev_shares"] = merged["prev_shares"].fillna(0).astype(int)
-    merged["curr_shares"] = merged["curr_shares"].fillna(0).astype(int)
-    merged["delta"] = merged["curr_shares"] - merged["prev_shares"]
-
-    def status_row(r):
-        if r["prev_shares"] == 0 and r["curr_shares"] > 0:
-            return "NEW"
-        if r["prev_shares"] > 0 and r["curr_shares"] == 0:
-            return "OUT"
-        if r["delta"] > 0:
-            return "UP"
-        if r["delta"] < 0:
-            return "DOWN"
-        return "SAME"
-
-    merged["status"] = merged.apply(status_row, axis=1)
-    order_map = {"NEW": 0, "UP": 1, "DOWN": 2, "OUT": 3, "SAME": 4}
-    merged["order"] = merged["status"].map(order_map).fillna(99)
-    merged = merged.sort_values(["order", "delta"], ascending=[True, False]).drop(columns=["order"])
+    prev_codes = prev_df["code"].astype("string").str.strip()
+    curr_codes = curr_df["code"].astype("string").str.strip()
+    prev_map = dict(zip(prev_codes, prev_df["shares"].fillna(0).astype(int)))
+    curr_map = dict(zip(curr_codes, curr_df["shares"].fillna(0).astype(int)))
+    name_map = dict(zip(prev_codes, prev_df["name"].fillna("")))
+    name_map.update((c, n) for c, n in zip(curr_codes, curr_df["name"].fillna("")) if n)
+    codes = sorted(prev_map.keys() | curr_map.keys())
+    merged = pd.DataFrame(
+        {
+            "code": pd.array(codes, dtype="string"),
+            "name": [name_map.get(c, "") for c in codes],
+            "prev_shares": np.array([prev_map.get(c, 0) for c in codes], dtype=np.int64),
+            "curr_shares": np.array([curr_map.get(c, 0) for c in codes], dtype=np.int64),
+        }
+    )
+    prev_shares = merged["prev_shares"].to_numpy()
+    curr_shares = merged["curr_shares"].to_numpy()
+    delta = curr_shares - prev_shares
+    merged["delta"] = delta
+    status = np.select(
+        [(prev_shares == 0) & (curr_shares > 0), (prev_shares > 0) & (curr_shares == 0), delta > 0, delta < 0],
+        ["NEW", "OUT", "UP", "DOWN"],
+        default="SAME",
+    )
+    merged["status"] = pd.Categorical(status, categories=STATUS_ORDER, ordered=True)
+    merged = merged.sort_values(["status", "delta"], ascending=[True, False])
     return merged[["code", "name", "prev_shares", "curr_shares", "delta", "status"]].reset_index(drop=True)
 
 
 def write_summary_markdown(diff_df: pd.DataFrame, out_md: pathlib.Path, data_date: str) -> None:
+    # Largest moves first: buys by descending delta, sells by ascending (most negative) delta.
+    sort_key = diff_df["delta"].where(diff_df["status"].isin(["DOWN", "OUT"]), -diff_df["delta"])
+    ranked = diff_df.iloc[np.argsort(sort_key.to_numpy(), kind="stable")]
+    groups = dict(tuple(ranked.groupby("status", sort=False, observed=True)))
+
     def top_rows(status, n=20):
-        sub = diff_df[diff_df["status"] == status].copy()
-        if status in ("DOWN", "OUT"):
-            sub = sub.sort_values("delta")
-        elif status in ("UP", "NEW"):
-            sub = sub.sort_values("delta", ascending=False)
-        return sub.head(n)
+        return groups[status].head(n) if status in groups else ranked.iloc[:0]
 
     lines = [f"# {ETF_CODE} Holdings Diff ({data_date})\n\n"]
     counts = diff_df["status"].value_counts().to_dict()
@@ -214,52 +302,49 @@ def write_summary_markdown(diff_df: pd.DataFrame, out_md: pathlib.Path, data_dat
             continue
         lines.append("| code | name | prev | curr | delta | status |\n")
         lines.append("|---|---|---:|---:|---:|---|\n")
-        for _, r in sub.iterrows():
-            name = str(r["name"]).replace("|", " ")
-            lines.append(f"| {r['code']} | {name} | {r['prev_shares']} | {r['curr_shares']} | {r['delta']} | {r['status']} |\n")
+        rows = sub[["code", "name", "prev_shares", "curr_shares", "delta", "status"]].to_numpy().tolist()
+        lines.extend(
+            "| {} | {} | {} | {} | {} | {} |\n".format(code, str(name).replace("|", " "), prev, curr, delta, status)
+            for code, name, prev, curr, delta, status in rows
+        )
         lines.append("\n")
 
     out_md.write_text("".join(lines), encoding="utf-8")
 
 
 def main():
-    base = pathlib.Path("data")
-    raw_dir = base / "raw"
-    out_dir = base / "out"
-    holdings_dir = out_dir / "holdings"
-    diff_csv_dir = out_dir / "diff" / "csv"
-    diff_md_dir = out_dir / "diff" / "md"
-    for folder in [raw_dir, holdings_dir, diff_csv_dir, diff_md_dir]:
+    for folder in [RAW_DIR, HOLDINGS_DIR, DIFF_CSV_DIR, DIFF_MD_DIR]:
         ensure_dir(folder)
 
-    session = requests.Session()
-    tmp_path = raw_dir / f"{ETF_CODE}_portfolio_tmp.xlsx"
-    download_xlsx(session, tmp_path)
+    session = get_session()
+    download_xlsx(session, TMP_XLSX_PATH)
+
+    digest = xlsx_content_digest(TMP_XLSX_PATH)
+    if LAST_DIGEST_PATH.exists() and LAST_DIGEST_PATH.read_text(encoding="utf-8").strip() == digest:
+        TMP_XLSX_PATH.unlink(missing_ok=True)
+        print("[INFO] XLSX content unchanged since last run; nothing to update.")
+        return
 
-    holdings_df, data_date = parse_holdings_from_xlsx(tmp_path)
+    holdings_df, data_date = parse_holdings_from_xlsx(TMP_XLSX_PATH)
     if not data_date:
         data_date = dt.date.today().strftime("%Y%m%d")
 
-    raw_path = raw_dir / f"{ETF_CODE}_portfolio_{data_date}.xlsx"
+    raw_path = RAW_DIR / f"{ETF_CODE}_portfolio_{data_date}.xlsx"
     if raw_path.exists():
-        tmp_path.unlink(missing_ok=True)
+        TMP_XLSX_PATH.unlink(missing_ok=True)
         print(f"[INFO] Raw XLSX already exists: {raw_path}")
     else:
-        tmp_path.replace(raw_path)
+        TMP_XLSX_PATH.replace(raw_path)
         print(f"[OK] Raw XLSX moved to: {raw_path}")
 
-    holdings_path = holdings_dir / f"{ETF_CODE}_holdings_{data_date}.csv"
+    holdings_path = HOLDINGS_DIR / f"{ETF_CODE}_holdings_{data_date}.csv"
     holdings_df.to_csv(holdings_path, index=False, encoding="utf-8-sig")
     print(f"[OK] Saved standardized holdings to {holdings_path}")
 
-    latest_path = holdings_dir / f"{ETF_CODE}_latest.csv"
-    root_latest_path = out_dir / f"{ETF_CODE}_latest.csv"
-    old_latest_path = out_dir / "00981A_latest.csv"
-
-    if latest_path.exists():
-        prev_df = pd.read_csv(latest_path, dtype={"code": "string"})
-    elif old_latest_path.exists():
-        prev_df = pd.read_csv(old_latest_path, dtype={"code": "string"})
+    if LATEST_PATH.exists():
+        prev_df = read_holdings_csv(LATEST_PATH)
+    elif ROOT_LATEST_PATH.exists():
+        prev_df = read_holdings_csv(ROOT_LATEST_PATH)
     else:
         prev_df = None
 
@@ -268,8 +353,8 @@ def main():
             print("[WARN] latest.csv format invalid; diff skipped.")
         else:
             diff_df = compute_diff(prev_df, holdings_df)
-            diff_csv_path = diff_csv_dir / f"{ETF_CODE}_diff_{data_date}.csv"
-            diff_md_path = diff_md_dir / f"{ETF_CODE}_diff_{data_date}.md"
+            diff_csv_path = DIFF_CSV_DIR / f"{ETF_CODE}_diff_{data_date}.csv"
+            diff_md_path = DIFF_MD_DIR / f"{ETF_CODE}_diff_{data_date}.md"
             diff_df.to_csv(diff_csv_path, index=False, encoding="utf-8-sig")
             write_summary_markdown(diff_df, diff_md_path, data_date)
             print(f"[OK] Saved diff CSV to {diff_csv_path}")
@@ -277,10 +362,11 @@ def main():
     else:
         print("[INFO] No previous latest.csv found; diff skipped.")
 
-    holdings_df.to_csv(latest_path, index=False, encoding="utf-8-sig")
-    holdings_df.to_csv(root_latest_path, index=False, encoding="utf-8-sig")
-    print(f"[OK] Updated latest to {latest_path}")
-    print(f"[OK] Updated root latest to {root_latest_path}")
+    shutil.copyfile(holdings_path, LATEST_PATH)
+    shutil.copyfile(holdings_path, ROOT_LATEST_PATH)
+    print(f"[OK] Updated latest to {LATEST_PATH}")
+    print(f"[OK] Updated root latest to {ROOT_LATEST_PATH}")
+    LAST_DIGEST_PATH.write_text(digest + "\n", encoding="utf-8")
 
 
 if __name__ == "__main__":